@@ -2,8 +2,17 @@
 BACtrack - Bluetooth breathalyzer client for BACtrack devices.
 """
 
-from .client import BACtrackClient
-from .ui import TerminalUI, ColorScheme, SCHEMES
-
 __version__ = "1.0.0"
 __all__ = ["BACtrackClient", "TerminalUI", "ColorScheme", "SCHEMES"]
+
+
+def __getattr__(name):
+    # Imported on first use so that commands which never touch Bluetooth,
+    # such as the git hook installer, do not pay for importing bleak.
+    if name == "BACtrackClient":
+        from .client import BACtrackClient
+        return BACtrackClient
+    if name in ("TerminalUI", "ColorScheme", "SCHEMES"):
+        from . import ui
+        return getattr(ui, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
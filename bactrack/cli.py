@@ -3,17 +3,17 @@ import asyncio
 import json
 import logging
 import os
-import shutil
-import stat
 import sys
+import tempfile
 from pathlib import Path
 import typer
 from .api_client import BACtrackAPIError, create_remote_test, stream_remote_test
-from .client import BACtrackClient
-from .ui import TerminalUI
 
 app = typer.Typer(help="BACtrack breathalyzer CLI")
 
+# The bundled hook script
+_HOOK_SRC = Path(__file__).resolve().parent.parent / "hooks" / "bacstop-hook"
+
 
 @app.command()
 def test(
@@ -43,12 +43,69 @@ VALID_SPICE = ("verde", "hot", "diablo")
 VALID_HOOKS = ("pre-commit", "pre-push")
 
 
+def _is_bacstop_hook(path) -> bool:
+    """Check whether the hook at path was installed by BACstop."""
+    if os.path.islink(path) and os.readlink(path) == str(_HOOK_SRC):
+        return True
+    try:
+        with open(path, "rb") as f:
+            # The marker sits in the script's header comment.
+            return b"BACstop" in f.read(4096)
+    except OSError:
+        return False
+
+
+def _link_hook(dest: Path) -> bool:
+    """Symlink dest to the bundled hook, returning False where links are unavailable."""
+    try:
+        os.symlink(_HOOK_SRC, dest)
+    except (OSError, NotImplementedError):
+        return False
+    return True
+
+
+def _write_hook(dest: Path, data: bytes) -> None:
+    """Write the hook script to a new executable file at dest."""
+    fd = os.open(
+        dest,
+        os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0),
+        0o755,
+    )
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _write_config(config_file: Path, content: str) -> None:
+    """Replace config_file atomically so the hook never reads a partial config."""
+    fd, tmp = tempfile.mkstemp(dir=config_file.parent, prefix=".bacstop.")
+    try:
+        # mkstemp creates the file 0600; give it the usual umask-derived mode.
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp, 0o666 & ~umask)
+        try:
+            os.write(fd, content.encode())
+        finally:
+            os.close(fd)
+        os.replace(tmp, config_file)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
 @app.command()
 def install(
     repo: str = typer.Option(".", "--repo", "-r", help="Path to git repo"),
     threshold: float = typer.Option(0.0, "--threshold", help="BAC threshold"),
     spice: str = typer.Option("hot", "--spice", "-s", help="Spice level: verde, hot, diablo"),
     hook: str = typer.Option("pre-push", "--hook", help="Hook type: pre-commit or pre-push"),
+    link: bool = typer.Option(
+        False,
+        "--link",
+        help="Symlink the hook to the installed package instead of copying it",
+    ),
 ):
     """Install BACstop git hook into a repo."""
     repo_path = Path(repo).resolve()
@@ -70,33 +127,38 @@ def install(
     hooks_dir.mkdir(exist_ok=True)
     dest = hooks_dir / hook
 
-    # Find the bundled hook script
-    hook_src = Path(__file__).resolve().parent.parent / "hooks" / "bacstop-hook"
-    if not hook_src.exists():
-        print(f"  Hook source not found at {hook_src}")
+    try:
+        hook_data = _HOOK_SRC.read_bytes()
+    except FileNotFoundError:
+        print(f"  Hook source not found at {_HOOK_SRC}")
         raise typer.Exit(1)
 
     # Remove any existing BACstop hook in the other slot
     other_hook = "pre-commit" if hook == "pre-push" else "pre-push"
     other_dest = hooks_dir / other_hook
-    if other_dest.exists():
-        other_content = other_dest.read_text()
-        if "BACstop" in other_content:
+    if os.path.lexists(other_dest):
+        if _is_bacstop_hook(other_dest):
             other_dest.unlink()
             print(f"  Removed old BACstop {other_hook} hook.")
 
-    if dest.exists():
+    if os.path.lexists(dest):
         print(f"  Overwriting existing {hook} hook.")
+        # Never write through an existing link, which may point at the
+        # bundled hook itself.
+        dest.unlink()
 
-    shutil.copy2(hook_src, dest)
-    dest.chmod(dest.stat().st_mode | stat.S_IEXEC)
+    linked = link and _link_hook(dest)
+    if link and not linked:
+        print("  Symlinks are unavailable here; copying the hook instead.")
+    if not linked:
+        _write_hook(dest, hook_data)
 
     # Write .bacstop config
-    config_file = repo_path / ".bacstop"
-    config_file.write_text(
+    _write_config(
+        repo_path / ".bacstop",
         f"threshold={threshold:.2f}\n"
         f"spice={spice}\n"
-        f"hook={hook}\n"
+        f"hook={hook}\n",
     )
 
     spice_desc = {
@@ -108,6 +170,9 @@ def install(
     print()
     print(f"  BACstop installed!")
     print(f"  Hook:      {dest}")
+    if linked:
+        print(f"  Links to:  {_HOOK_SRC}")
+        print("  Uninstalling or moving the bactrack package disables this hook.")
     print(f"  Threshold: {threshold:.2f}%")
     print(f"  Spice:     {spice} ({spice_desc[spice]})")
     print()
@@ -125,14 +190,23 @@ def uninstall(
     hooks_dir = repo_path / ".git" / "hooks"
     removed = False
 
+    try:
+        with os.scandir(hooks_dir) as it:
+            hooks = {
+                entry.name: entry.path
+                for entry in it
+                if entry.name in VALID_HOOKS
+                and (entry.is_file() or entry.is_symlink())
+            }
+    except FileNotFoundError:
+        hooks = {}
+
     for hook_name in VALID_HOOKS:
-        hook_path = hooks_dir / hook_name
-        if hook_path.exists():
-            content = hook_path.read_text()
-            if "BACstop" in content:
-                hook_path.unlink()
-                print(f"  Removed BACstop {hook_name} hook.")
-                removed = True
+        hook_path = hooks.get(hook_name)
+        if hook_path is not None and _is_bacstop_hook(hook_path):
+            os.unlink(hook_path)
+            print(f"  Removed BACstop {hook_name} hook.")
+            removed = True
 
     if not removed:
         print("  No BACstop hooks found.")
@@ -216,24 +290,23 @@ def api_test(
 
 async def run_test_with_ui(theme: str, no_ui: bool):
     """Run test with UI."""
+    from .client import BACtrackClient
+    from .ui import TerminalUI
+
     ui = TerminalUI(theme) if not no_ui else None
     client = BACtrackClient()
     try:
         (ui.show_connecting() if ui else print("Connecting..."))
         await client.connect()
-        await asyncio.sleep(1)
         if ui:
-            ui.show_connected(client.device_address)
-            await asyncio.sleep(2)
+            # The device's own countdown notifications replace this screen.
             ui.show_get_ready()
-            await asyncio.sleep(2)
         result = await client.take_test(
             callback=ui.update_from_notification if ui else lambda n: print(n['message']),
             timeout=60.0
         )
         if result is not None:
             (ui.show_result(result) if ui else print(f"\nBAC: {result:.4f}%"))
-            await asyncio.sleep(5) if ui else None
         else:
             (ui.show_error("Test failed") if ui else print("Test failed"))
     except Exception as e:
@@ -245,26 +318,34 @@ async def run_test_with_ui(theme: str, no_ui: bool):
 
 async def run_check(threshold: float, quiet: bool) -> int:
     """Check BAC against threshold."""
+    from .client import BACtrackClient
+
     client = BACtrackClient()
     try:
-        print(f"🔍 Checking BAC (threshold: {threshold:.2f}%)...") if not quiet else None
+        if not quiet:
+            print(f"🔍 Checking BAC (threshold: {threshold:.2f}%)...")
         await client.connect()
         result = await client.take_test(
-            callback=lambda n: None if quiet else print(f"  {n['message']}"),
+            callback=None if quiet else lambda n: print(f"  {n['message']}"),
             timeout=60.0
         )
         if result is None:
-            print("❌ Test failed") if not quiet else None
+            if not quiet:
+                print("❌ Test failed")
             return 2
-        print(f"\n📊 BAC: {result:.4f}%") if not quiet else None
+        if not quiet:
+            print(f"\n📊 BAC: {result:.4f}%")
         if result >= threshold:
-            print(f"✅ Above threshold - ALLOWED") if not quiet else None
+            if not quiet:
+                print(f"✅ Above threshold - ALLOWED")
             return 0
         else:
-            print(f"🚫 Below threshold - BLOCKED") if not quiet else None
+            if not quiet:
+                print(f"🚫 Below threshold - BLOCKED")
             return 1
     except Exception as e:
-        print(f"❌ Error: {e}") if not quiet else None
+        if not quiet:
+            print(f"❌ Error: {e}")
         return 2
     finally:
         await client.disconnect()
@@ -272,6 +353,8 @@ async def run_check(threshold: float, quiet: bool) -> int:
 
 async def show_device_info():
     """Show device info."""
+    from .client import BACtrackClient
+
     client = BACtrackClient()
     try:
         print("🔍 Scanning...")
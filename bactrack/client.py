@@ -3,13 +3,81 @@ BACtrack Bluetooth Client - Clean implementation based on reverse engineered pro
 """
 import asyncio
 import logging
+import os
+from pathlib import Path
 from bleak import BleakScanner, BleakClient
-from typing import Optional, Callable
-import struct
+from bleak.backends.device import BLEDevice
+from typing import Optional, Callable, Union
 
 
 logger = logging.getLogger(__name__)
 
+# Address of the last device connected to, so later runs can skip the scan.
+_ADDRESS_CACHE = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "bactrack"
+    / "address"
+)
+
+
+def _read_cached_address() -> Optional[str]:
+    try:
+        return _ADDRESS_CACHE.read_text().strip() or None
+    except OSError:
+        return None
+
+
+def _write_cached_address(address: str) -> None:
+    try:
+        _ADDRESS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        _ADDRESS_CACHE.write_text(address)
+    except OSError:
+        # Debug only: git hooks run `bactrack check --quiet` and expect no output.
+        logger.debug(
+            "Could not cache BACtrack device address",
+            extra={"event": "address_cache_write_failed"},
+        )
+
+
+def _fixed_status(notification_type: str, message: str, **values):
+    """Build a decoder for a status packet whose data byte is unused."""
+    status = (notification_type, message, values)
+    return lambda data: status
+
+
+def _seconds_status(notification_type: str, template: str):
+    """Build a decoder for a status packet carrying a seconds counter."""
+    def decode(data: bytes):
+        if len(data) < 3:
+            return None
+        seconds = data[2]
+        return notification_type, template.format(seconds), {"value": seconds}
+    return decode
+
+
+# Status notifications keyed by their two-byte prefix. Decoders return
+# (type, message, values), or None when the packet is too short.
+_STATUS_DECODERS = {
+    # Countdown/warmup
+    b"\x80\x01": _seconds_status("countdown", "Warming up... {}s"),
+    b"\x80\x02": _fixed_status("start_blow", "BEGIN BLOWING NOW!"),
+    b"\x80\x03": _seconds_status("keep_blowing", "Keep blowing... {}s"),
+    b"\x80\x04": _fixed_status("analyzing", "Analyzing sample..."),
+    b"\x80\x05": _fixed_status("finalizing", "Finalizing results..."),
+    b"\x80\x06": _fixed_status("wrapping_up", "Test wrapping up..."),
+    # Cancelled/timeout
+    b"\x80\x07": _fixed_status("cancelled", "Test cancelled or timed out"),
+    # Blow error (insufficient breath)
+    b"\x80\x08": _fixed_status("blow_error", "Blow error - insufficient breath detected"),
+    # The official C6 SDK maps status 0x0a to
+    # MOBILE__ERROR_LOW_BATTERY (0x04).
+    b"\x80\x0a": _fixed_status(
+        "error",
+        "BACtrack battery is too low to start a test",
+        error_code="low_battery",
+    ),
+}
+
 
 class BACtrackClient:
     """Client for communicating with BACtrack breathalyzers via Bluetooth LE."""
@@ -25,6 +93,11 @@ class BACtrackClient:
     # characteristic callback. The overall breath-test timeout starts later.
     GATT_OPERATION_TIMEOUT = 10.0
 
+    # bleak scans for an address before connecting to it. A nearby device
+    # advertises well within this, and an absent one should fall back to
+    # discovery quickly.
+    CACHED_CONNECT_TIMEOUT = 3.0
+
     def __init__(self, device_address: Optional[str] = None):
         """
         Initialize BACtrack client.
@@ -36,6 +109,8 @@ class BACtrackClient:
         self.client: Optional[BleakClient] = None
         self.bac_result: Optional[float] = None
         self._test_complete = asyncio.Event()
+        self._write_without_response = False
+        self._discovered_device: Optional[BLEDevice] = None
 
     async def find_device(self) -> str:
         """Scan for and return address of first BACtrack device found."""
@@ -44,26 +119,93 @@ class BACtrackClient:
             return self.device_address
 
         logger.info("BACtrack discovery started", extra={"event": "discovery_started"})
-        devices = await BleakScanner.discover(timeout=10.0)
-
-        for device in devices:
-            if device.name and "bactrack" in device.name.lower():
-                self.device_address = device.address
-                logger.info("BACtrack device found", extra={"event": "device_found"})
-                return device.address
+        # Stops scanning at the first matching advertisement.
+        device = await BleakScanner.find_device_by_filter(
+            lambda device, advertisement: bool(device.name)
+            and "bactrack" in device.name.lower(),
+            timeout=10.0,
+        )
+        if device is None:
+            raise RuntimeError("No BACtrack device found")
 
-        raise RuntimeError("No BACtrack device found")
+        self.device_address = device.address
+        self._discovered_device = device
+        logger.info("BACtrack device found", extra={"event": "device_found"})
+        return device.address
 
     async def connect(self) -> bool:
-        """Connect to the BACtrack device."""
-        address = await self.find_device()
-        self.client = BleakClient(address, timeout=20.0)
+        """
+        Connect to the BACtrack device.
+
+        Without an explicit address, the last connected device is tried
+        first and discovery only runs if it cannot be reached.
+        """
+        cached = None if self.device_address else _read_cached_address()
+        connected = False
+        if cached:
+            logger.info("BACtrack cached device used", extra={"event": "device_cached"})
+            try:
+                connected = await self._connect_to(
+                    cached, self.CACHED_CONNECT_TIMEOUT, cached_address=cached
+                )
+            except Exception as exc:
+                # Debug only: git hooks run `bactrack check --quiet` and
+                # expect no output when the device is merely off.
+                logger.debug(
+                    "BACtrack cached device unavailable, scanning: %s",
+                    exc,
+                    extra={"event": "cached_device_unavailable"},
+                )
+
+        if connected:
+            self.device_address = cached
+        else:
+            address = await self.find_device()
+            # Reuse the discovered device so bleak does not scan for it again.
+            device = self._discovered_device or address
+            connected = await self._connect_to(device, 20.0, cached_address=cached)
+
+        if connected:
+            self._write_without_response = self._supports_write_without_response()
+        return connected
+
+    def _supports_write_without_response(self) -> bool:
+        """
+        Check whether the start command can skip the ATT write response.
+
+        PROTOCOL.md documents the characteristic as Write/Notify only, so
+        acknowledged writes remain the default.
+        """
+        characteristic = self.client.services.get_characteristic(self.CHAR_UUID)
+        return (
+            characteristic is not None
+            and "write-without-response" in characteristic.properties
+        )
+
+    async def _connect_to(
+        self,
+        device: Union[str, BLEDevice],
+        timeout: float,
+        cached_address: Optional[str] = None,
+    ) -> bool:
+        """
+        Connect to an address or discovered device and remember its address.
+
+        Args:
+            device: Bluetooth address, or a BLEDevice returned by discovery.
+            timeout: Connection timeout, including bleak's scan for an address.
+            cached_address: Address already in the cache, which is not rewritten.
+        """
+        self.client = BleakClient(device, timeout=timeout)
         await self.client.connect()
         if self.client.is_connected:
             logger.info(
                 "BACtrack connection established",
                 extra={"event": "connection_established"},
             )
+            address = device if isinstance(device, str) else device.address
+            if address != cached_address:
+                _write_cached_address(address)
         return self.client.is_connected
 
     async def disconnect(self):
@@ -81,115 +223,47 @@ class BACtrackClient:
         """
         # Always include the raw packet so callers can retain protocol evidence.
         full_hex = data.hex()
-        byte_array = [f"{b:02x}" for b in data]
-
-        def notification(notification_type, message, **values):
-            logger.debug(
-                "BACtrack notification received: type=%s raw=%s",
-                notification_type,
-                full_hex,
-                extra={
-                    "event": "raw_notification",
-                    "notification_type": notification_type,
-                    "raw_notification": full_hex,
-                },
-            )
-            return {
+
+        def notification(notification_type, message, raw_bytes=False, **values):
+            # Skip building the log record's extra dict unless it will be emitted.
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "BACtrack notification received: type=%s raw=%s",
+                    notification_type,
+                    full_hex,
+                    extra={
+                        "event": "raw_notification",
+                        "notification_type": notification_type,
+                        "raw_notification": full_hex,
+                    },
+                )
+            decoded = {
                 "type": notification_type,
                 "message": message,
                 "raw_hex": full_hex,
-                "bytes": byte_array,
                 **values,
             }
+            if raw_bytes:
+                # Only results and unrecognised packets are worth picking apart.
+                decoded["bytes"] = [f"{b:02x}" for b in data]
+            return decoded
 
         if len(data) < 2:
-            return notification("unknown", "Invalid packet")
-
-        hex_str = data.hex()
-        prefix = hex_str[:4]
-
-        # Countdown/warmup
-        if prefix == "8001" and len(data) >= 3:
-            seconds = data[2]
-            return notification("countdown", f"Warming up... {seconds}s", value=seconds)
-
-        # Begin blowing
-        elif prefix == "8002":
-            return notification("start_blow", "BEGIN BLOWING NOW!")
-
-        # Keep blowing
-        elif prefix == "8003" and len(data) >= 3:
-            remaining = data[2]
-            return notification("keep_blowing", f"Keep blowing... {remaining}s", value=remaining)
-
-        # Analyzing
-        elif prefix == "8004":
-            return notification("analyzing", "Analyzing sample...")
-
-        # Finalizing
-        elif prefix == "8005":
-            return notification("finalizing", "Finalizing results...")
+            return notification("unknown", "Invalid packet", raw_bytes=True)
 
-        # Wrapping up
-        elif prefix == "8006":
-            return notification("wrapping_up", "Test wrapping up...")
-
-        # Cancelled/timeout
-        elif prefix == "8007":
-            return notification("cancelled", "Test cancelled or timed out")
-
-        # Blow error (insufficient breath)
-        elif prefix == "8008":
-            return notification("blow_error", "Blow error - insufficient breath detected")
-
-        # The official C6 SDK maps status 0x0a to
-        # MOBILE__ERROR_LOW_BATTERY (0x04).
-        elif prefix == "800a":
-            return notification(
-                "error",
-                "BACtrack battery is too low to start a test",
-                error_code="low_battery",
-            )
+        # bleak delivers bytearray, which cannot be used as a dict key.
+        decoder = _STATUS_DECODERS.get(bytes(data[:2]))
+        if decoder is not None:
+            status = decoder(data)
+            if status is not None:
+                notification_type, message, values = status
+                return notification(notification_type, message, **values)
 
         # BAC Result
-        elif hex_str.startswith("81") and len(data) >= 5:
-            # Try parsing from different byte positions and divisors
-            # Let's examine all possibilities
-            attempts = {}
-
-            # Bytes 2-3
-            if len(data) >= 4:
-                val_2_3 = struct.unpack("<H", data[2:4])[0]
-                attempts["bytes_2_3"] = {
-                    "raw": val_2_3,
-                    "div_100": val_2_3 / 100.0,
-                    "div_1000": val_2_3 / 1000.0,
-                    "div_10000": val_2_3 / 10000.0,
-                }
-
-            # Bytes 3-4
-            if len(data) >= 5:
-                val_3_4 = struct.unpack("<H", data[3:5])[0]
-                attempts["bytes_3_4"] = {
-                    "raw": val_3_4,
-                    "div_100": val_3_4 / 100.0,
-                    "div_1000": val_3_4 / 1000.0,
-                    "div_10000": val_3_4 / 10000.0,
-                }
-
-            # Bytes 4-5 (old wrong guess)
-            if len(data) >= 6:
-                val_4_5 = struct.unpack("<H", data[4:6])[0]
-                attempts["bytes_4_5"] = {
-                    "raw": val_4_5,
-                    "div_100": val_4_5 / 100.0,
-                    "div_1000": val_4_5 / 1000.0,
-                    "div_10000": val_4_5 / 10000.0,
-                }
-
-            # CORRECT: Bytes 2-3 with divisor 10000
-            val_2_3 = struct.unpack("<H", data[2:4])[0]
-            bac_percent = val_2_3 / 10000.0
+        if data[0] == 0x81 and len(data) >= 5:
+            # Bytes 2-3 are a little-endian BAC in ten-thousandths of a percent.
+            bac_raw = int.from_bytes(data[2:4], "little")
+            bac_percent = bac_raw / 10000.0
 
             logger.info(
                 "BACtrack raw result packet",
@@ -203,13 +277,12 @@ class BACtrackClient:
             return notification(
                 "result",
                 f"BAC Result: {bac_percent:.4f}%",
+                raw_bytes=True,
                 value=bac_percent,
-                raw_value=val_2_3,
+                raw_value=bac_raw,
             )
 
-        # Unknown
-        else:
-            return notification("unknown", f"Unknown: {hex_str}")
+        return notification("unknown", f"Unknown: {full_hex}", raw_bytes=True)
 
     async def take_test(
         self,
@@ -233,20 +306,35 @@ class BACtrackClient:
         self.bac_result = None
         self._test_complete.clear()
 
-        # Internal notification handler
+        loop = asyncio.get_running_loop()
+        notifications: asyncio.Queue = asyncio.Queue()
+
+        # Internal notification handler. Some bleak backends call it from
+        # their own thread, so it only decodes and hands off to the loop.
         def notification_handler(sender, data: bytes):
             decoded = self._decode_notification(data)
+            loop.call_soon_threadsafe(notifications.put_nowait, decoded)
 
-            # Call user callback if provided
-            if callback:
-                callback(decoded)
+        async def consume_notifications():
+            while True:
+                decoded = await notifications.get()
 
-            # Check if test is complete
-            if decoded["type"] == "result":
-                self.bac_result = decoded["value"]
-                self._test_complete.set()
-            elif decoded["type"] in ["cancelled", "blow_error", "error"]:
-                self._test_complete.set()
+                # Call user callback if provided
+                if callback:
+                    try:
+                        callback(decoded)
+                    except Exception:
+                        logger.exception(
+                            "BACtrack notification callback failed",
+                            extra={"event": "callback_exception"},
+                        )
+
+                # Check if test is complete
+                if decoded["type"] == "result":
+                    self.bac_result = decoded["value"]
+                    self._test_complete.set()
+                elif decoded["type"] in ["cancelled", "blow_error", "error"]:
+                    self._test_complete.set()
 
         logger.info(
             "Subscribing to BACtrack notifications",
@@ -266,6 +354,8 @@ class BACtrackClient:
             extra={"event": "notification_subscribe_complete"},
         )
 
+        # Anything delivered before this point is already waiting in the queue.
+        consumer = asyncio.ensure_future(consume_notifications())
         try:
             # Send start command
             logger.info(
@@ -277,7 +367,7 @@ class BACtrackClient:
                     self.client.write_gatt_char(
                         self.CHAR_UUID,
                         self.CMD_START_TEST,
-                        response=True,
+                        response=not self._write_without_response,
                     ),
                     timeout=self.GATT_OPERATION_TIMEOUT,
                 )
@@ -290,10 +380,23 @@ class BACtrackClient:
                 extra={"event": "start_command_write_complete"},
             )
 
-            # Wait for test to complete or timeout
+            # Wait for test to complete or timeout. A timer that sets the
+            # completion event avoids wrapping the wait in a wait_for task.
+            timed_out = False
+
+            def on_timeout():
+                nonlocal timed_out
+                if not self._test_complete.is_set():
+                    timed_out = True
+                    self._test_complete.set()
+
+            timeout_handle = loop.call_later(timeout, on_timeout)
             try:
-                await asyncio.wait_for(self._test_complete.wait(), timeout=timeout)
-            except asyncio.TimeoutError:
+                await self._test_complete.wait()
+            finally:
+                timeout_handle.cancel()
+
+            if timed_out:
                 logger.warning(
                     "BACtrack test timed out",
                     extra={"event": "test_timeout", "timeout_seconds": timeout},
@@ -302,6 +405,12 @@ class BACtrackClient:
                     callback({"type": "timeout", "message": "Test timed out"})
 
         finally:
+            consumer.cancel()
+            try:
+                await consumer
+            except asyncio.CancelledError:
+                pass
+
             # Unsubscribe
             try:
                 await asyncio.wait_for(
@@ -1,5 +1,15 @@
 """Terminal UI components for BACtrack tests."""
+import asyncio
 import os
+import sys
+
+# Cursor home + erase screen + erase scrollback, matching clear(1).
+CLEAR_SCREEN = "\033[H\033[2J\033[3J"
+CURSOR_HOME = "\033[H"
+ERASE_BELOW = "\033[J"
+
+BOX_TOP = f"        ╔{'═' * 32}╗\n"
+BOX_BOTTOM = f"        ╚{'═' * 32}╝\n"
 
 
 class ColorScheme:
@@ -29,101 +39,152 @@ class TerminalUI:
     """Terminal UI for breath tests."""
     def __init__(self, color_scheme="default"):
         self.colors = SCHEMES.get(color_scheme, SCHEMES["default"]) if isinstance(color_scheme, str) else color_scheme
+        c = self.colors
+        self._header = (
+            f"\n{c.header}{'='*60}{c.reset}\n"
+            f"{c.bold}{c.header}                    BACtrack Breath Test{c.reset}\n"
+            f"{c.header}{'='*60}{c.reset}\n\n"
+        )
+        self._frames = {
+            "connecting": self._header
+            + f"{c.countdown}🔍 Scanning for BACtrack device...{c.reset}\n\n",
+            "get_ready": self._header + self._box(c.countdown, "         GET READY...           "),
+            "blow_now": self._header + self._box(c.blow, "        💨 BLOW NOW! 💨         "),
+            "analyzing": self._header + self._box(c.analyzing, "      🔬 Analyzing...           "),
+        }
+        self._keep_blowing_frames = [self._render_keep_blowing(seconds) for seconds in range(6)]
+        self._screen = None
+        self._pending = None
+        if os.name == 'nt':
+            # Enables VT escape sequence processing in the Windows console.
+            os.system('')
 
     def clear(self):
-        os.system('clear' if os.name != 'nt' else 'cls')
+        self._screen = None
+        self._pending = None
+        sys.stdout.write(CLEAR_SCREEN)
+        sys.stdout.flush()
+
+    def _redraw(self, screen):
+        """
+        Clear for a new screen, or repaint in place when it is already shown.
+
+        Returns the suffix to write after the frame: an in-place repaint must
+        erase anything printed below the previous frame, such as log lines.
+        """
+        if self._screen == screen:
+            self._pending = None
+            sys.stdout.write(CURSOR_HOME)
+            return ERASE_BELOW
+        self.clear()
+        self._screen = screen
+        return ""
 
-    def show_header(self):
+    @staticmethod
+    def _write(frame):
+        """Emit a whole frame with a single write."""
+        sys.stdout.write(frame)
+        sys.stdout.flush()
+
+    def _box(self, color, *lines, leading="\n"):
+        """Render a bordered box whose lines are already padded to width."""
         c = self.colors
-        print(f"\n{c.header}{'='*60}{c.reset}")
-        print(f"{c.bold}{c.header}                    BACtrack Breath Test{c.reset}")
-        print(f"{c.header}{'='*60}{c.reset}\n")
+        rows = "".join(f"        ║{line}║\n" for line in lines)
+        return f"{leading}{c.bold}{color}\n{BOX_TOP}{rows}{BOX_BOTTOM}{c.reset}\n\n"
+
+    def _render_keep_blowing(self, seconds):
+        c = self.colors
+        filled = 5 - min(max(seconds, 0), 5)
+        bar = "█" * (6 * filled) + "░" * (30 - 6 * filled)
+        return (
+            self._header
+            + self._box(c.blow, "      Keep Blowing...           ")
+            + f"        {c.blow}[{bar}]{c.reset}\n"
+            + f"        {c.countdown}{seconds} seconds remaining{c.reset}\n\n"
+        )
+
+    def show_header(self):
+        self._write(self._header)
 
     def show_connecting(self):
         self.clear()
-        self.show_header()
-        print(f"{self.colors.countdown}🔍 Scanning for BACtrack device...{self.colors.reset}\n")
+        self._write(self._frames["connecting"])
 
     def show_connected(self, address):
         self.clear()
-        self.show_header()
-        print(f"{self.colors.blow}✅ Connected to device{self.colors.reset}\n")
+        c = self.colors
+        self._write(f"{self._header}{c.blow}✅ Connected to device{c.reset}\n\n")
 
     def show_get_ready(self):
         self.clear()
-        self.show_header()
-        c = self.colors
-        print(f"\n{c.bold}{c.countdown}")
-        print("        ╔════════════════════════════════╗")
-        print("        ║         GET READY...           ║")
-        print("        ╚════════════════════════════════╝")
-        print(f"{c.reset}\n")
+        self._write(self._frames["get_ready"])
 
     def show_countdown(self, seconds):
-        self.clear()
-        self.show_header()
-        c = self.colors
-        print(f"\n{c.bold}{c.countdown}")
-        print("        ╔════════════════════════════════╗")
-        print(f"        ║         Warming Up: {seconds:2d}         ║")
-        print("        ╚════════════════════════════════╝")
-        print(f"{c.reset}\n")
+        tail = self._redraw("countdown")
+        self._write(
+            self._header
+            + self._box(self.colors.countdown, f"         Warming Up: {seconds:2d}         ")
+            + tail
+        )
 
     def show_blow_now(self):
         self.clear()
-        self.show_header()
-        c = self.colors
-        print(f"\n{c.bold}{c.blow}")
-        print("        ╔════════════════════════════════╗")
-        print("        ║        💨 BLOW NOW! 💨         ║")
-        print("        ╚════════════════════════════════╝")
-        print(f"{c.reset}\n")
+        self._write(self._frames["blow_now"])
 
     def show_keep_blowing(self, seconds):
-        self.clear()
-        self.show_header()
-        c = self.colors
-        print(f"\n{c.bold}{c.blow}")
-        print("        ╔════════════════════════════════╗")
-        print("        ║      Keep Blowing...           ║")
-        print("        ╚════════════════════════════════╝")
-        print(f"{c.reset}\n")
-        filled = 5 - seconds
-        bar = "█" * (6 * filled) + "░" * (30 - 6 * filled)
-        print(f"        {c.blow}[{bar}]{c.reset}")
-        print(f"        {c.countdown}{seconds} seconds remaining{c.reset}\n")
+        tail = self._redraw("keep_blowing")
+        if 0 <= seconds < len(self._keep_blowing_frames):
+            self._write(self._keep_blowing_frames[seconds] + tail)
+        else:
+            self._write(self._render_keep_blowing(seconds) + tail)
 
     def show_analyzing(self):
         self.clear()
-        self.show_header()
-        c = self.colors
-        print(f"\n{c.bold}{c.analyzing}")
-        print("        ╔════════════════════════════════╗")
-        print("        ║      🔬 Analyzing...           ║")
-        print("        ╚════════════════════════════════╝")
-        print(f"{c.reset}\n")
+        self._write(self._frames["analyzing"])
 
     def show_result(self, bac):
         self.clear()
-        self.show_header()
         c = self.colors
         color = c.result_sober if bac == 0.0 else (c.result_under if bac < 0.08 else c.result_over)
         status = "Sober" if bac == 0.0 else ("Under Legal Limit" if bac < 0.08 else "Over Legal Limit")
         content_width = 32
-        print(f"{c.bold}{color}")
-        print(f"        ╔{'═' * content_width}╗")
-        print(f"        ║{f'BAC: {bac:.4f}%':^{content_width}}║")
-        print(f"        ║{status:^{content_width}}║")
-        print("        ╚════════════════════════════════╝")
-        print(f"{c.reset}\n")
+        self._write(
+            self._header
+            + self._box(
+                color,
+                f"{f'BAC: {bac:.4f}%':^{content_width}}",
+                f"{status:^{content_width}}",
+                leading="",
+            )
+        )
 
     def show_error(self, message):
         self.clear()
-        self.show_header()
-        print(f"\n{self.colors.result_over}❌ {message}{self.colors.reset}\n")
+        c = self.colors
+        self._write(f"{self._header}\n{c.result_over}❌ {message}{c.reset}\n\n")
 
     def update_from_notification(self, notification):
-        """Update UI based on notification."""
+        """
+        Update UI based on notification.
+
+        The repaint is deferred to the running event loop, so a burst of
+        notifications only draws the latest one.
+        """
+        scheduled = self._pending is not None
+        self._pending = notification
+        if scheduled:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._render_pending()
+        else:
+            loop.call_soon(self._render_pending)
+
+    def _render_pending(self):
+        notification, self._pending = self._pending, None
+        if notification is None:
+            return
         msg_type = notification['type']
         if msg_type == 'countdown':
             self.show_countdown(notification.get('value', 0))
@@ -0,0 +1,108 @@
+import os
+import stat
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from typer.testing import CliRunner
+
+from bactrack import cli
+
+
+class HookInstallTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        root = Path(tmp.name)
+        self.repo = root / "repo"
+        (self.repo / ".git").mkdir(parents=True)
+        self.hooks = self.repo / ".git" / "hooks"
+        self.hook_src = root / "bacstop-hook"
+        self.hook_src.write_bytes(b"#!/bin/sh\n# BACstop git hook\nexit 0\n")
+        patcher = mock.patch("bactrack.cli._HOOK_SRC", self.hook_src)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.runner = CliRunner()
+
+    def invoke(self, *args):
+        result = self.runner.invoke(cli.app, [*args, "--repo", str(self.repo)])
+        self.assertEqual(result.exit_code, 0, result.output)
+        return result.output
+
+    def test_install_copies_hook_by_default(self):
+        self.invoke("install")
+
+        dest = self.hooks / "pre-push"
+        self.assertFalse(dest.is_symlink())
+        self.assertEqual(dest.read_bytes(), self.hook_src.read_bytes())
+        self.assertTrue(dest.stat().st_mode & stat.S_IXUSR)
+
+    def test_link_install_points_at_bundled_hook(self):
+        output = self.invoke("install", "--link")
+
+        dest = self.hooks / "pre-push"
+        self.assertTrue(dest.is_symlink())
+        self.assertEqual(os.readlink(dest), str(self.hook_src))
+        self.assertIn(f"Links to:  {self.hook_src}", output)
+
+    def test_dangling_link_is_recognised_as_bacstop_hook(self):
+        self.invoke("install", "--link")
+        self.hook_src.unlink()
+
+        self.assertTrue(cli._is_bacstop_hook(self.hooks / "pre-push"))
+
+    def test_overwriting_link_does_not_write_through_it(self):
+        self.invoke("install", "--link")
+        original = self.hook_src.read_bytes()
+        upgraded = self.hook_src.with_name("bacstop-hook-v2")
+        upgraded.write_bytes(b"#!/bin/sh\n# BACstop git hook v2\n")
+
+        with mock.patch("bactrack.cli._HOOK_SRC", upgraded):
+            self.invoke("install")
+
+        dest = self.hooks / "pre-push"
+        self.assertFalse(dest.is_symlink())
+        self.assertEqual(dest.read_bytes(), upgraded.read_bytes())
+        self.assertEqual(self.hook_src.read_bytes(), original)
+
+    def test_uninstall_removes_link_but_not_bundled_hook(self):
+        self.invoke("install", "--link")
+
+        output = self.invoke("uninstall")
+
+        self.assertIn("Removed BACstop pre-push hook.", output)
+        self.assertFalse(os.path.lexists(self.hooks / "pre-push"))
+        self.assertTrue(self.hook_src.is_file())
+
+
+class ConfigWriteTests(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.config = Path(tmp.name) / ".bacstop"
+        umask = os.umask(0o022)
+        self.addCleanup(os.umask, umask)
+
+    def test_config_is_replaced_with_umask_mode(self):
+        self.config.write_text("threshold=0.08\n")
+        self.config.chmod(0o600)
+
+        cli._write_config(self.config, "threshold=0.00\nspice=hot\n")
+
+        self.assertEqual(self.config.read_text(), "threshold=0.00\nspice=hot\n")
+        self.assertEqual(stat.S_IMODE(self.config.stat().st_mode), 0o644)
+
+    def test_failed_write_leaves_no_temp_file(self):
+        self.config.write_text("threshold=0.08\n")
+
+        with mock.patch("bactrack.cli.os.write", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                cli._write_config(self.config, "threshold=0.00\n")
+
+        self.assertEqual(self.config.read_text(), "threshold=0.08\n")
+        self.assertEqual(list(self.config.parent.glob(".bacstop.*")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
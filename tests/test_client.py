@@ -1,5 +1,10 @@
 import asyncio
+import tempfile
+import threading
 import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
 
 from bactrack.client import BACtrackClient
 
@@ -24,7 +29,27 @@ class ResultDecoderTests(unittest.TestCase):
 
         self.assertEqual(decoded["type"], "countdown")
         self.assertEqual(decoded["raw_hex"], packet.hex())
-        self.assertEqual(decoded["bytes"], ["80", "01", "05", "00", "15", "e7"])
+        self.assertNotIn("bytes", decoded)
+
+    def test_unknown_notification_includes_byte_breakdown(self):
+        decoded = BACtrackClient._decode_notification(bytes.fromhex("80 09 00"))
+
+        self.assertEqual(decoded["type"], "unknown")
+        self.assertEqual(decoded["bytes"], ["80", "09", "00"])
+
+    def test_status_notification_accepts_bytearray(self):
+        decoded = BACtrackClient._decode_notification(
+            bytearray.fromhex("80 03 02 00 15 e7")
+        )
+
+        self.assertEqual(decoded["type"], "keep_blowing")
+        self.assertEqual(decoded["value"], 2)
+
+    def test_truncated_countdown_is_unknown(self):
+        decoded = BACtrackClient._decode_notification(bytes.fromhex("80 01"))
+
+        self.assertEqual(decoded["type"], "unknown")
+        self.assertEqual(decoded["message"], "Unknown: 8001")
 
     def test_low_battery_status_is_a_terminal_device_error(self):
         decoded = BACtrackClient._decode_notification(bytes.fromhex("80 0a 00 00 15 e7"))
@@ -37,6 +62,183 @@ class ResultDecoderTests(unittest.TestCase):
         )
 
 
+class DiscoveryTests(unittest.IsolatedAsyncioTestCase):
+    async def test_discovery_returns_first_bactrack_advertisement(self):
+        seen = [
+            SimpleNamespace(name=None, address="AA"),
+            SimpleNamespace(name="Headphones", address="BB"),
+            SimpleNamespace(name="BACtrack C6", address="CC"),
+        ]
+
+        async def find_device_by_filter(filter_func, timeout):
+            return next((d for d in seen if filter_func(d, None)), None)
+
+        client = BACtrackClient()
+        with mock.patch(
+            "bactrack.client.BleakScanner.find_device_by_filter",
+            side_effect=find_device_by_filter,
+        ):
+            address = await client.find_device()
+
+        self.assertEqual(address, "CC")
+        self.assertEqual(client.device_address, "CC")
+
+    async def test_discovery_without_match_raises(self):
+        client = BACtrackClient()
+        with mock.patch(
+            "bactrack.client.BleakScanner.find_device_by_filter",
+            new=mock.AsyncMock(return_value=None),
+        ):
+            with self.assertRaisesRegex(RuntimeError, "No BACtrack device found"):
+                await client.find_device()
+
+
+class FakeBleakClient:
+    reachable = set()
+    attempts = []
+    connected = []
+    properties = ["write", "notify"]
+
+    def __init__(self, device, timeout):
+        self.address = device if isinstance(device, str) else device.address
+        self.is_connected = False
+        type(self).attempts.append((device, timeout))
+        self.services = SimpleNamespace(get_characteristic=self.get_characteristic)
+
+    def get_characteristic(self, uuid):
+        return SimpleNamespace(properties=type(self).properties)
+
+    async def connect(self):
+        if self.address not in self.reachable:
+            raise OSError(f"{self.address} unreachable")
+        self.is_connected = True
+        type(self).connected.append(self.address)
+
+
+class CachedAddressTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache = Path(tmp.name) / "bactrack" / "address"
+        self.discovered = SimpleNamespace(name="BACtrack C6", address="CC")
+        self.scan = mock.AsyncMock(return_value=self.discovered)
+        FakeBleakClient.attempts = []
+        FakeBleakClient.connected = []
+        for patcher in (
+            mock.patch("bactrack.client._ADDRESS_CACHE", self.cache),
+            mock.patch("bactrack.client.BleakClient", FakeBleakClient),
+            mock.patch("bactrack.client.BleakScanner.find_device_by_filter", self.scan),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_cached_address_skips_discovery(self):
+        self.cache.parent.mkdir(parents=True)
+        self.cache.write_text("AA\n")
+        FakeBleakClient.reachable = {"AA"}
+        client = BACtrackClient()
+
+        self.assertTrue(await client.connect())
+
+        self.assertEqual(client.device_address, "AA")
+        self.scan.assert_not_called()
+
+    async def test_unreachable_cached_address_falls_back_to_discovery(self):
+        self.cache.parent.mkdir(parents=True)
+        self.cache.write_text("AA")
+        FakeBleakClient.reachable = {"CC"}
+        client = BACtrackClient()
+
+        self.assertTrue(await client.connect())
+
+        self.assertEqual(client.device_address, "CC")
+        self.assertEqual(FakeBleakClient.connected, ["CC"])
+        self.assertEqual(self.cache.read_text(), "CC")
+
+    async def test_cached_attempt_is_short_and_scan_result_is_reused(self):
+        self.cache.parent.mkdir(parents=True)
+        self.cache.write_text("AA")
+        FakeBleakClient.reachable = {"CC"}
+
+        await BACtrackClient().connect()
+
+        self.assertEqual(
+            FakeBleakClient.attempts,
+            [("AA", BACtrackClient.CACHED_CONNECT_TIMEOUT), (self.discovered, 20.0)],
+        )
+
+    async def test_unreachable_cached_address_is_logged_only_at_debug(self):
+        self.cache.parent.mkdir(parents=True)
+        self.cache.write_text("AA")
+        FakeBleakClient.reachable = {"CC"}
+
+        with self.assertLogs("bactrack.client", level="DEBUG") as logs:
+            await BACtrackClient().connect()
+
+        fallback = [r for r in logs.records if "cached device unavailable" in r.getMessage()]
+        self.assertEqual([r.levelname for r in fallback], ["DEBUG"])
+        self.assertIsNone(fallback[0].exc_info)
+
+    async def test_unchanged_cached_address_is_not_rewritten(self):
+        self.cache.parent.mkdir(parents=True)
+        self.cache.write_text("AA")
+        FakeBleakClient.reachable = {"AA"}
+
+        with mock.patch("bactrack.client._write_cached_address") as write:
+            await BACtrackClient().connect()
+
+        write.assert_not_called()
+
+
+class WriteModeTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        FakeBleakClient.reachable = {"AA"}
+        FakeBleakClient.properties = ["write", "notify"]
+        self.addCleanup(setattr, FakeBleakClient, "properties", ["write", "notify"])
+        self.scan = mock.AsyncMock()
+        for patcher in (
+            mock.patch("bactrack.client._read_cached_address", return_value="AA"),
+            mock.patch("bactrack.client._write_cached_address"),
+            mock.patch("bactrack.client.BleakClient", FakeBleakClient),
+            mock.patch("bactrack.client.BleakScanner.find_device_by_filter", self.scan),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_write_only_characteristic_keeps_write_response(self):
+        client = BACtrackClient()
+        await client.connect()
+        fake_client = DeviceErrorClient()
+        client.client = fake_client
+
+        await client.take_test(timeout=1)
+
+        self.assertTrue(fake_client.response)
+
+    async def test_start_command_skips_write_response_when_supported(self):
+        FakeBleakClient.properties = ["write", "write-without-response", "notify"]
+        client = BACtrackClient()
+        await client.connect()
+        fake_client = DeviceErrorClient()
+        client.client = fake_client
+
+        await client.take_test(timeout=1)
+
+        self.assertFalse(fake_client.response)
+
+    async def test_characteristic_lookup_error_does_not_trigger_a_scan(self):
+        client = BACtrackClient()
+
+        with mock.patch.object(
+            FakeBleakClient, "get_characteristic", side_effect=RuntimeError("no services")
+        ):
+            with self.assertRaisesRegex(RuntimeError, "no services"):
+                await client.connect()
+
+        self.scan.assert_not_called()
+        self.assertTrue(client.client.is_connected)
+
+
 class HangingNotifyClient:
     is_connected = True
 
@@ -67,12 +269,42 @@ class DeviceErrorClient:
         self.callback = callback
 
     async def write_gatt_char(self, characteristic, value, response):
+        self.response = response
         self.callback(characteristic, bytes.fromhex("80 0a 00 00 15 e7"))
 
     async def stop_notify(self, characteristic):
         pass
 
 
+class ThreadedResultClient:
+    is_connected = True
+
+    async def start_notify(self, characteristic, callback):
+        self.callback = callback
+
+    async def write_gatt_char(self, characteristic, value, response):
+        packet = bytes.fromhex("81 30 d0 00 00 d4 01 48 00 ef 05 8b 0a 31 06 1a 00")
+        thread = threading.Thread(target=self.callback, args=(characteristic, packet))
+        thread.start()
+        thread.join()
+
+    async def stop_notify(self, characteristic):
+        pass
+
+
+class SilentClient:
+    is_connected = True
+
+    async def start_notify(self, characteristic, callback):
+        pass
+
+    async def write_gatt_char(self, characteristic, value, response):
+        pass
+
+    async def stop_notify(self, characteristic):
+        pass
+
+
 class GattTimeoutTests(unittest.IsolatedAsyncioTestCase):
     async def test_notification_subscription_has_a_bounded_timeout(self):
         client = BACtrackClient()
@@ -109,6 +341,32 @@ class GattTimeoutTests(unittest.IsolatedAsyncioTestCase):
         self.assertIsNone(result)
         self.assertEqual(notifications[0]["error_code"], "low_battery")
 
+    async def test_notifications_from_backend_thread_reach_the_loop(self):
+        callback_threads = []
+        client = BACtrackClient()
+        client.client = ThreadedResultClient()
+
+        result = await client.take_test(
+            callback=lambda notification: callback_threads.append(threading.get_ident()),
+            timeout=1,
+        )
+
+        self.assertEqual(result, 0.0208)
+        self.assertEqual(callback_threads, [threading.get_ident()])
+
+    async def test_silent_device_reports_test_timeout(self):
+        notifications = []
+        client = BACtrackClient()
+        client.client = SilentClient()
+
+        result = await client.take_test(callback=notifications.append, timeout=0.01)
+
+        self.assertIsNone(result)
+        self.assertEqual(
+            notifications,
+            [{"type": "timeout", "message": "Test timed out"}],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
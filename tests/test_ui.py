@@ -1,8 +1,9 @@
+import asyncio
 import io
 import unittest
 from contextlib import redirect_stdout
 
-from bactrack.ui import TerminalUI
+from bactrack.ui import CLEAR_SCREEN, CURSOR_HOME, ERASE_BELOW, TerminalUI
 
 
 class ResultLayoutTests(unittest.TestCase):
@@ -25,5 +26,61 @@ class ResultLayoutTests(unittest.TestCase):
         self.assertEqual({len(line) for line in box_lines}, {42})
 
 
+class RedrawTests(unittest.TestCase):
+    def test_repeated_countdown_repaints_in_place(self):
+        ui = TerminalUI()
+        output = io.StringIO()
+
+        with redirect_stdout(output):
+            ui.show_countdown(5)
+            ui.show_countdown(4)
+
+        frames = output.getvalue()
+        self.assertEqual(frames.count(CLEAR_SCREEN), 1)
+        self.assertEqual(frames.count(CURSOR_HOME), 2)
+        self.assertIn("Warming Up:  4", frames)
+
+    def test_in_place_repaint_erases_output_below_the_frame(self):
+        ui = TerminalUI()
+        output = io.StringIO()
+
+        with redirect_stdout(output):
+            ui.show_keep_blowing(5)
+            first = len(output.getvalue())
+            print("stray log line")
+            ui.show_keep_blowing(4)
+
+        frames = output.getvalue()
+        self.assertNotIn(ERASE_BELOW, frames[:first])
+        self.assertTrue(frames.endswith(ERASE_BELOW))
+        self.assertLess(frames.rindex(CURSOR_HOME), frames.index("4 seconds remaining"))
+
+
+class NotificationCoalescingTests(unittest.IsolatedAsyncioTestCase):
+    async def test_burst_of_notifications_draws_only_the_latest(self):
+        ui = TerminalUI()
+        drawn = []
+        ui.show_countdown = lambda seconds: drawn.append(("countdown", seconds))
+        ui.show_blow_now = lambda: drawn.append(("start_blow",))
+
+        ui.update_from_notification({"type": "countdown", "value": 0})
+        ui.update_from_notification({"type": "start_blow"})
+        await asyncio.sleep(0)
+
+        self.assertEqual(drawn, [("start_blow",)])
+
+    async def test_direct_draw_discards_pending_notification(self):
+        ui = TerminalUI()
+        drawn = []
+        ui.show_analyzing = lambda: drawn.append("analyzing")
+
+        with redirect_stdout(io.StringIO()):
+            ui.update_from_notification({"type": "analyzing"})
+            ui.show_result(0.0)
+            await asyncio.sleep(0)
+
+        self.assertEqual(drawn, [])
+
+
 if __name__ == "__main__":
     unittest.main()